@@ -9,8 +9,11 @@
     - DocumentCache: Модель закешированного документа.
 """
 
+import asyncio
+import time
+from collections import OrderedDict
 from collections.abc import Mapping
-from typing import Any, Self
+from typing import Any, ClassVar, Self
 
 from beanie import Document, PydanticObjectId
 from motor.motor_asyncio import AsyncIOMotorClientSession
@@ -23,8 +26,18 @@ class DocumentCache(Document):
 
     Этот класс используется для работы с документами, которые хранятся в
     другой базе данных, управляемой другим микросервисом.
+
+    Поверх локальной базы работает небольшой LRU-кеш процесса с TTL:
+    повторные чтения горячих документов обслуживаются из памяти без
+    запроса к MongoDB. Мутации (`save`, `replace`, `delete`) вытесняют
+    документ из кеша через `invalidate`.
     """
 
+    _load_locks: ClassVar[dict[Any, asyncio.Lock]] = {}
+    _cache: ClassVar[OrderedDict[Any, tuple[float, "DocumentCache"]]] = OrderedDict()
+    _cache_max: ClassVar[int] = 1024
+    _cache_ttl: ClassVar[float] = 60.0
+
     id: PydanticObjectId = Field(  # type: ignore
         alias="_id",
         description="MongoDB document ObjectID",
@@ -42,6 +55,15 @@ class DocumentCache(Document):
         nesting_depths_per_field: dict[str, int] | None = None,
         **pymongo_kwargs,
     ) -> Self | None:
+        cache_key = (cls, document_id)
+        if not ignore_cache:
+            entry = cls._cache.get(cache_key)
+            if entry:
+                ts, cached = entry
+                if time.monotonic() - ts < cls._cache_ttl:
+                    cls._cache.move_to_end(cache_key)
+                    return cached  # type: ignore
+                cls._cache.pop(cache_key, None)
         document = await super().get(
             document_id=document_id,
             session=session,
@@ -53,33 +75,77 @@ class DocumentCache(Document):
             **pymongo_kwargs,
         )
         if not document:
-            await cls.load({"_id": document_id})
-            document = await super().get(
-                document_id=document_id,
-                session=session,
-                ignore_cache=ignore_cache,
-                fetch_links=fetch_links,
-                with_children=with_children,
-                nesting_depth=nesting_depth,
-                nesting_depths_per_field=nesting_depths_per_field,
-                **pymongo_kwargs,
-            )
+            lock_key = (cls, document_id)
+            lock = cls._load_locks.setdefault(lock_key, asyncio.Lock())
+            if lock.locked():
+                # Загрузка этого документа уже идет в соседней корутине:
+                # дожидаемся ее и забираем документ из локальной базы.
+                async with lock:
+                    document = await super().get(
+                        document_id=document_id,
+                        session=session,
+                        ignore_cache=ignore_cache,
+                        fetch_links=fetch_links,
+                        with_children=with_children,
+                        nesting_depth=nesting_depth,
+                        nesting_depths_per_field=nesting_depths_per_field,
+                        **pymongo_kwargs,
+                    )
+            else:
+                async with lock:
+                    document = await cls.load({"_id": document_id})
+                cls._load_locks.pop(lock_key, None)
+        if document and not ignore_cache:
+            cls._cache[cache_key] = (time.monotonic(), document)
+            cls._cache.move_to_end(cache_key)
+            while len(cls._cache) > cls._cache_max:
+                cls._cache.popitem(last=False)
         return document
 
+    @classmethod
+    def invalidate(cls, document_id: Any):
+        """
+        Вытеснение документа из локального кеша процесса.
+
+        Args:
+            document_id (Any): Идентификатор документа.
+        """
+        cls._cache.pop((cls, document_id), None)
+
+    async def save(self, *args, **kwargs):
+        result = await super().save(*args, **kwargs)
+        self.invalidate(self.id)
+        return result
+
+    async def replace(self, *args, **kwargs):
+        result = await super().replace(*args, **kwargs)
+        self.invalidate(self.id)
+        return result
+
+    async def delete(self, *args, **kwargs):
+        result = await super().delete(*args, **kwargs)
+        self.invalidate(self.id)
+        return result
+
     @classmethod
     async def load(
         cls,
         query: Mapping[str, Any],
-    ):
+    ) -> Self | None:
         """
         Загрузка документа из другой базы данных микросервиса.
 
-        Этот метод должен быть реализован в подклассе для загрузки документа
-        из внешнего источника.
+        Этот метод должен быть реализован в подклассе: он загружает документ
+        из внешнего источника, сохраняет его в локальной базе (например, через
+        `await obj.insert()`) и возвращает загруженный экземпляр — `get` отдает
+        его напрямую, без повторного запроса к локальной базе.
 
         Args:
             query (Mapping[str, Any]): Параметры запроса для получения документа.
 
+        Returns:
+            Self | None: Загруженный документ или None, если он не найден.
+
         Raises:
             NotImplementedError: Если метод не реализован в подклассе.
         """
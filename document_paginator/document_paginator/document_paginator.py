@@ -1,3 +1,5 @@
+import asyncio
+import copy
 from typing import Generic, TypeVar
 
 from beanie import Document
@@ -16,13 +18,53 @@ class DocumentPaginator(BaseModel, Generic[T]):
 
     @classmethod
     async def from_find(
-        cls, find: FindMany[T], limit: int, offset: int | None = None
+        cls,
+        find: FindMany[T],
+        limit: int,
+        offset: int | None = None,
+        exact_count: bool = False,
     ) -> "DocumentPaginator[T]":
         if offset is None:
             offset = 0
+        if limit == 0:
+            return cls(
+                limit=limit,
+                offset=offset,
+                count=await cls._count(find, exact_count),
+                result=[],
+            )
+        if offset == 0:
+            result = await copy.copy(find).skip(offset).limit(limit).to_list()
+            count = (
+                len(result)
+                if len(result) < limit
+                else await cls._count(find, exact_count)
+            )
+        else:
+            count, result = await asyncio.gather(
+                cls._count(find, exact_count),
+                copy.copy(find).skip(offset).limit(limit).to_list(),
+            )
         return cls(
             limit=limit,
             offset=offset,
-            count=await find.count(),
-            result=await find.skip(offset).limit(limit).to_list(),
+            count=count,
+            result=result,
         )
+
+    @staticmethod
+    async def _count(find: FindMany[T], exact_count: bool) -> int:
+        """
+        Подсчет документов по запросу.
+
+        Для запроса без фильтров (типовой первый экран списка) и
+        exact_count=False используется estimated_document_count — мгновенный
+        ответ из метаданных коллекции вместо полного прохода countDocuments.
+        Для запросов с фильтрами оценка по метаданным некорректна, поэтому
+        всегда выполняется обычный count.
+        """
+        if not exact_count and not find.get_filter_query():
+            return (
+                await find.document_model.get_motor_collection().estimated_document_count()
+            )
+        return await find.count()
@@ -1,8 +1,9 @@
 from . import constants
-from .email_sender import EmailSender, config_email_sender
+from .email_sender import EmailSender, close_email_sender, config_email_sender
 
 __all__ = [
     "constants",
     "EmailSender",
     "config_email_sender",
+    "close_email_sender",
 ]
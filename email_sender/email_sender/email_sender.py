@@ -1,26 +1,29 @@
 """
 Модуль для отправки электронных писем.
 
-Этот модуль предоставляет функциональность для асинхронной отправки писем с использованием библиотеки aiosmtplib. 
+Этот модуль предоставляет функциональность для асинхронной отправки писем с использованием библиотеки aiosmtplib.
 Он поддерживает текстовые и HTML сообщения, а также возможность прикрепления файлов.
 
 Зависимости:
     - aiosmtplib: Библиотека для асинхронной отправки SMTP сообщений.
-    - config: Модуль с настройками проекта, включая данные для SMTP сервера.
-    - utils.grid_fs.file: Модуль для работы с файлами.
+    - file_manager: Модуль для работы с файлами.
 
 Классы:
-    - MailBodyType: Перечисление для определения типа тела письма.
-
-Функции:
-    - send_mail(subject: str, body: str, to_email: str, from_email: str, files: list[File], body_type: MAIL_BODY_TYPE_CHOICES): Асинхронно отправляет электронное письмо.
+    - SMTPConfig: Настройки SMTP сервера.
+    - EmailSender: Класс с методом отправки писем.
 
 Примечания:
-    - В режиме разработки (DEV) адрес получателя заменяется на тестовый адрес.
+    - Если в настройках указан test_email, адрес получателя заменяется на него.
     - При отправке письма могут возникнуть ошибки, связанные с библиотекой aiosmtplib.
 """
 
+import asyncio
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from email import encoders
 from email.mime.application import MIMEApplication
+from email.mime.base import MIMEBase
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
@@ -30,10 +33,150 @@ from file_manager import File
 
 from .constants import MailBodyType
 
-_SMTP_SERVER: str = ""
-_SMTP_PORT: int = 0
-_SMTP_USERNAME: str = ""
-_SMTP_PASSWORD: str = ""
+
+@dataclass(frozen=True)
+class SMTPConfig:
+    """
+    Настройки SMTP сервера.
+
+    Attrs:
+        server (str): Адрес SMTP сервера.
+        port (int): Порт SMTP сервера.
+        username (str): Имя пользователя SMTP сервера.
+        password (str): Пароль SMTP сервера.
+        test_email (str | None): Тестовый адрес получателя; если указан,
+            все письма отправляются на него.
+    """
+
+    server: str
+    port: int
+    username: str
+    password: str
+    test_email: str | None = None
+
+
+_config: SMTPConfig | None = None
+
+_smtp_pool: asyncio.Queue | None = None
+
+
+@asynccontextmanager
+async def _acquire_smtp() -> AsyncGenerator[aiosmtplib.SMTP, None]:
+    """
+    Получение SMTP-клиента из пула.
+
+    Клиент подключается лениво при первом использовании, проверяется на
+    живость через noop и переподключается при необходимости, после чего
+    возвращается обратно в пул.
+    """
+    assert _smtp_pool is not None
+    smtp = await _smtp_pool.get()
+    try:
+        if smtp.is_connected:
+            try:
+                await smtp.noop()
+            except aiosmtplib.SMTPException:
+                try:
+                    await smtp.quit()
+                except aiosmtplib.SMTPException:
+                    pass
+        if not smtp.is_connected:
+            await smtp.connect()
+        yield smtp
+    finally:
+        _smtp_pool.put_nowait(smtp)
+
+
+async def _send_message(msg: MIMEBase, config: SMTPConfig):
+    """
+    Отправка собранного сообщения.
+
+    Использует пул долгоживущих SMTP-соединений, если он настроен через
+    `config_email_sender`; иначе открывает соединение на одну отправку.
+
+    Args:
+        msg (MIMEBase): Собранное сообщение.
+        config (SMTPConfig): Настройки SMTP сервера.
+    """
+    if _smtp_pool is not None:
+        async with _acquire_smtp() as smtp:
+            await smtp.send_message(msg)
+    else:
+        await aiosmtplib.send(
+            msg,
+            hostname=config.server,
+            port=config.port,
+            start_tls=True,
+            username=config.username,
+            password=config.password,
+        )
+
+
+def _build_mime(
+    subject: str,
+    body: str,
+    to_email: str,
+    from_email: str,
+    body_type: str,
+    attachments: list[tuple[bytes, str, str]],
+) -> MIMEBase:
+    """
+    Сборка MIME-сообщения.
+
+    Синхронная функция: вложения приходят уже закодированными в base64,
+    но сборка multipart-сообщения сама по себе не бесплатна, поэтому
+    функция выполняется в пуле потоков, чтобы не блокировать event loop.
+
+    Args:
+        subject (str): Тема письма.
+        body (str): Тело сообщения.
+        to_email (str): Адрес почты, на который отправляется письмо.
+        from_email (str): Адрес почты отправителя.
+        body_type (str): Тип тела письма.
+        attachments (list[tuple[bytes, str, str]]): Список вложений
+            в виде кортежей (данные в base64, название, тип контента).
+
+    Returns:
+        MIMEBase: Собранное сообщение. Без вложений — обычный MIMEText,
+            без генерации multipart-границ.
+    """
+    if not attachments:
+        msg = MIMEText(body, body_type, "utf-8")
+        msg["From"] = from_email
+        msg["To"] = to_email
+        msg["Subject"] = subject
+        return msg
+    msg = MIMEMultipart()
+    msg["From"] = from_email
+    msg["To"] = to_email
+    msg["Subject"] = subject
+    msg.attach(MIMEText(body, body_type))
+    for data_b64, name, content_type in attachments:
+        # Данные уже закодированы в base64 (File.read_b64), поэтому
+        # повторное кодирование отключено через encode_noop
+        part = MIMEApplication(b"", _encoder=encoders.encode_noop, Name=name)
+        part.set_payload(data_b64)
+        part["Content-Transfer-Encoding"] = "base64"
+        part["Content-Disposition"] = f'attachment; filename="{name}"'
+        part.add_header("Content-Type", content_type)
+        msg.attach(part)
+    return msg
+
+
+async def _read_attachments(files: list[File] | None) -> list[tuple[bytes, str, str]]:
+    """
+    Чтение вложений из GridFS.
+
+    Args:
+        files (list[File] | None): Список файлов для вложения.
+
+    Returns:
+        list[tuple[bytes, str, str]]: Список кортежей
+            (данные в base64, название, тип контента).
+    """
+    if not files:
+        return []
+    return [(await file.read_b64(), file.name, file.content_type) for file in files]
 
 
 class EmailSender:
@@ -43,7 +186,7 @@ class EmailSender:
         subject: str,
         body: str,
         to_email: str,
-        from_email: str = _SMTP_USERNAME,  # type: ignore
+        from_email: str | None = None,
         files: list[File] | None = None,
         body_type: MailBodyType = MailBodyType.PLAIN,
     ):
@@ -54,16 +197,17 @@ class EmailSender:
             subject (str): Тема письма.
             body (str): Тело сообщения.
             to_email (str): Адрес почты, на который отправляется письмо.
-            from_email (str): Адрес почты отправителя.
+            from_email (str | None): Адрес почты отправителя
+                (по умолчанию имя пользователя SMTP сервера).
             files (list[File]): Список файлов для вложения (по умолчанию None).
             body_type (MailBodyType): Тип тела письма (по умолчанию MailBodyType.PLAIN).
 
         Notes:
-            - В режиме разработки (DEV) адрес получателя заменяется на тестовый адрес, указанный в настройках.
+            - Если в настройках указан test_email, адрес получателя заменяется на него.
             - Возможны ошибки при отправке письма, связанные с библиотекой aiosmtplib.
 
         Example:
-            await send_mail(
+            await EmailSender.send(
                 subject="Тестовое письмо",
                 body="Это тестовое сообщение",
                 to_email="recipient@example.com",
@@ -71,26 +215,24 @@ class EmailSender:
                 body_type=MailBodyType.HTML
             )
         """
-        # Создание сообщения
-        msg = MIMEMultipart()
-        msg["From"] = from_email
-        msg["To"] = to_email
-        msg["Subject"] = subject
-        msg.attach(MIMEText(body, body_type.value))
-        if files:
-            for file in files:
-                part = MIMEApplication(await file.read(), Name=file.name)
-                part["Content-Disposition"] = f'attachment; filename="{file.name}"'
-                part.add_header("Content-Type", file.content_type)
-                msg.attach(part)
-        await aiosmtplib.send(
-            msg,
-            hostname=_SMTP_SERVER,
-            port=_SMTP_PORT,
-            start_tls=True,
-            username=_SMTP_USERNAME,
-            password=_SMTP_PASSWORD,
+        config = _config
+        if config is None:
+            raise RuntimeError(
+                "SMTP server is not configured, call config_email_sender first"
+            )
+        # Создание сообщения в пуле потоков, чтобы не блокировать event loop
+        attachments = await _read_attachments(files)
+        msg = await asyncio.get_running_loop().run_in_executor(
+            None,
+            _build_mime,
+            subject,
+            body,
+            config.test_email or to_email,
+            from_email or config.username,
+            body_type.value,
+            attachments,
         )
+        await _send_message(msg, config)
 
 
 async def config_email_sender(
@@ -99,49 +241,60 @@ async def config_email_sender(
     smtp_username: str | None = None,
     smtp_password: str | None = None,
     test_email: str | None = None,
+    pool_size: int = 1,
 ):
-    if smtp_server:
-        global _SMTP_SERVER
-        _SMTP_SERVER = smtp_server
-    if smtp_port:
-        global _SMTP_PORT
-        _SMTP_PORT = smtp_port
-    if smtp_username:
-        global _SMTP_USERNAME
-        _SMTP_USERNAME = smtp_username
-    if smtp_password:
-        global _SMTP_PASSWORD
-        _SMTP_PASSWORD = smtp_password
-
-    if test_email:
-
-        async def test_send(
-            subject: str,
-            body: str,
-            to_email: str,
-            from_email: str = _SMTP_USERNAME,
-            files: list[File] | None = None,
-            body_type: MailBodyType = MailBodyType.PLAIN,
-        ):
-            _ = to_email
-            msg = MIMEMultipart()
-            msg["From"] = from_email
-            msg["To"] = test_email
-            msg["Subject"] = subject
-            msg.attach(MIMEText(body, body_type.value))
-            if files:
-                for file in files:
-                    part = MIMEApplication(await file.read(), Name=file.name)
-                    part["Content-Disposition"] = f'attachment; filename="{file.name}"'
-                    part.add_header("Content-Type", file.content_type)
-                    msg.attach(part)
-            await aiosmtplib.send(
-                msg,
-                hostname=_SMTP_SERVER,
-                port=_SMTP_PORT,
-                start_tls=True,
-                username=_SMTP_USERNAME,
-                password=_SMTP_PASSWORD,
+    """
+    Настройка отправителя писем.
+
+    Args:
+        smtp_server (str | None): Адрес SMTP сервера.
+        smtp_port (int | None): Порт SMTP сервера.
+        smtp_username (str | None): Имя пользователя SMTP сервера.
+        smtp_password (str | None): Пароль SMTP сервера.
+        test_email (str | None): Тестовый адрес получателя; если указан,
+            все письма отправляются на него.
+        pool_size (int): Размер пула SMTP-соединений
+            (0 — отправка без пула, с соединением на каждое письмо).
+    """
+    global _config
+    _config = SMTPConfig(
+        server=smtp_server or "",
+        port=smtp_port or 0,
+        username=smtp_username or "",
+        password=smtp_password or "",
+        test_email=test_email,
+    )
+
+    if pool_size > 0:
+        global _smtp_pool
+        _smtp_pool = asyncio.Queue()
+        for _ in range(pool_size):
+            _smtp_pool.put_nowait(
+                aiosmtplib.SMTP(
+                    hostname=_config.server,
+                    port=_config.port,
+                    username=_config.username,
+                    password=_config.password,
+                    start_tls=True,
+                )
             )
 
-        EmailSender.send = test_send
+
+async def close_email_sender():
+    """
+    Закрытие пула SMTP-соединений.
+
+    Функция должна быть вызвана при остановке приложения, если пул был
+    настроен через `config_email_sender`.
+    """
+    global _smtp_pool
+    if _smtp_pool is None:
+        return
+    while not _smtp_pool.empty():
+        smtp = _smtp_pool.get_nowait()
+        if smtp.is_connected:
+            try:
+                await smtp.quit()
+            except aiosmtplib.SMTPException:
+                pass
+    _smtp_pool = None
@@ -57,13 +57,7 @@ class FileExtensionGroup(str, Enum):
         Returns:
             dict[str, ContentType]: Карта типов контента файла
         """
-        if self == FileExtensionGroup.IMAGE:
-            return IMAGE_CONTENT_TYPE_MAP
-        if self == FileExtensionGroup.VIDEO:
-            return VIDEO_CONTENT_TYPE_MAP
-        if self == FileExtensionGroup.DOCUMENT:
-            return DOCUMENT_CONTENT_TYPE_MAP
-        return CONTENT_TYPE_MAP
+        return _GROUP_CONTENT_TYPE_MAP[self]
 
 
 # Фото файлы
@@ -115,6 +109,15 @@ CONTENT_TYPE_MAP = {
     **OTHER_CONTENT_TYPE_MAP,
 }
 
+# Карта "группа расширений -> карта типов контента", собранная один раз при
+# импорте, чтобы content_type_map не перебирал группы на каждом вызове
+_GROUP_CONTENT_TYPE_MAP = {
+    FileExtensionGroup.IMAGE: IMAGE_CONTENT_TYPE_MAP,
+    FileExtensionGroup.VIDEO: VIDEO_CONTENT_TYPE_MAP,
+    FileExtensionGroup.DOCUMENT: DOCUMENT_CONTENT_TYPE_MAP,
+    FileExtensionGroup.ALL: CONTENT_TYPE_MAP,
+}
+
 
 class FileEncoding(str, Enum):
     """
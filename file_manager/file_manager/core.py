@@ -2,17 +2,24 @@
 Модуль с сервисом для работы с файлами через GridFS
 """
 
+import io
+
 from beanie import PydanticObjectId
 from bson import ObjectId
 from gridfs import NoFile
 from motor.motor_asyncio import (
     AsyncIOMotorClient,
+    AsyncIOMotorCollection,
+    AsyncIOMotorCursor,
     AsyncIOMotorGridFSBucket,
+    AsyncIOMotorGridIn,
     AsyncIOMotorGridOut,
     AsyncIOMotorGridOutCursor,
 )
 
 grid_fs_bucket: AsyncIOMotorGridFSBucket
+fs_files_collection: AsyncIOMotorCollection
+fs_chunks_collection: AsyncIOMotorCollection
 
 
 class GridFSService:
@@ -48,6 +55,44 @@ class GridFSService:
         )
         return file_id
 
+    @staticmethod
+    def open_upload_stream(
+        filename: str,
+        metadata: dict,
+    ) -> AsyncIOMotorGridIn:
+        """
+        Открытие потока для загрузки файла в grid_fs по чанкам
+
+        Args:
+            filename (str): Название файла
+            metadata (dict): Метаданные файла
+
+        Returns:
+            AsyncIOMotorGridIn: Поток для записи файла
+
+        Notes:
+            - Функция может отдавать ошибки motor библиотеки в ходе выполнения
+        """
+
+        return grid_fs_bucket.open_upload_stream(filename, metadata=metadata)
+
+    @staticmethod
+    async def get_file_info(file_id: PydanticObjectId) -> dict | None:
+        """
+        Получение документа файла из коллекции fs.files
+
+        В отличие от open_download_stream не открывает поток чтения чанков —
+        один небольшой запрос только за метаданными.
+
+        Args:
+            file_id(str | ObjectId | PydanticObjectId): Идентификатор файла
+
+        Returns:
+            dict | None: Документ файла или None, если файл не найден
+        """
+
+        return await fs_files_collection.find_one({"_id": file_id})
+
     @staticmethod
     async def find_files(
         query: dict,
@@ -67,6 +112,31 @@ class GridFSService:
 
         return grid_fs_bucket.find(query)
 
+    @staticmethod
+    def find_file_infos(
+        query: dict,
+        projection: dict | None = None,
+    ) -> AsyncIOMotorCursor:
+        """
+        Получение курсора на документы файлов из коллекции fs.files
+
+        В отличие от find_files не создает объекты чтения GridFS — отдает
+        легковесные документы только с нужными полями.
+
+        Args:
+            query(dict): Параметры запроса
+            projection(dict | None): Проекция полей; по умолчанию
+                _id, filename и metadata
+
+        Returns:
+            AsyncIOMotorCursor: Курсор на документы файлов
+        """
+
+        return fs_files_collection.find(
+            query,
+            projection or {"_id": 1, "filename": 1, "metadata": 1},
+        )
+
     @staticmethod
     async def download_file(file_id: PydanticObjectId) -> AsyncIOMotorGridOut:
         """
@@ -84,6 +154,29 @@ class GridFSService:
 
         return await grid_fs_bucket.open_download_stream(file_id)
 
+    @staticmethod
+    async def download_to_bytes(file_id: PydanticObjectId) -> bytes:
+        """
+        Чтение содержимого файла из grid_fs в байты
+
+        В отличие от open_download_stream + read не тратит отдельный
+        запрос на открытие потока — метаданные и чанки читаются одной
+        логической операцией.
+
+        Args:
+            file_id(str | ObjectId | PydanticObjectId): Идентификатор файла
+
+        Returns:
+            bytes: Содержимое файла
+
+        Notes:
+            - Функция может отдавать ошибки motor библиотеки в ходе выполнения
+        """
+
+        buf = io.BytesIO()
+        await grid_fs_bucket.download_to_stream(file_id, buf)
+        return buf.getvalue()
+
     @staticmethod
     async def delete_file(
         file_id: PydanticObjectId,
@@ -104,6 +197,28 @@ class GridFSService:
         except NoFile:
             return False
 
+    @staticmethod
+    async def bulk_delete_files(query: dict) -> list[ObjectId]:
+        """
+        Массовое удаление файлов из grid_fs по параметрам запроса
+
+        Удаляет файлы и их чанки двумя запросами delete_many вместо
+        удаления по одному файлу.
+
+        Args:
+            query(dict): Параметры запроса к коллекции fs.files
+
+        Returns:
+            list[ObjectId]: Идентификаторы удаленных файлов
+        """
+
+        file_ids = await fs_files_collection.distinct("_id", query)
+        if not file_ids:
+            return []
+        await fs_chunks_collection.delete_many({"files_id": {"$in": file_ids}})
+        await fs_files_collection.delete_many({"_id": {"$in": file_ids}})
+        return file_ids
+
     @staticmethod
     async def open_download_stream(
         file_id: PydanticObjectId,
@@ -121,8 +236,47 @@ class GridFSService:
         return await grid_fs_bucket.open_download_stream(file_id)
 
 
-async def config_file_manager(mongo_uri: str, db_name: str):
-    client = AsyncIOMotorClient(str(mongo_uri))
+async def config_file_manager(
+    mongo_uri: str,
+    db_name: str,
+    min_pool_size: int = 0,
+    max_pool_size: int = 100,
+    appname: str | None = None,
+    compressors: str | None = None,
+):
+    """
+    Настройка файлового менеджера.
+
+    Args:
+        mongo_uri (str): URI для подключения к MongoDB.
+        db_name (str): Название базы данных.
+        min_pool_size (int): Минимальное количество соединений в пуле.
+            Значение больше нуля держит пул прогретым между запросами.
+        max_pool_size (int): Максимальное количество соединений в пуле.
+        appname (str | None): Имя приложения для логов и профайлера MongoDB.
+        compressors (str | None): Алгоритмы сжатия wire-протокола через
+            запятую (например "zstd,snappy"); требуют соответствующих
+            библиотек.
+
+    Notes:
+        - В конце выполняется ping, чтобы рукопожатие с сервером прошло при
+          старте приложения, а не в первом пользовательском запросе.
+    """
+    client_kwargs: dict = {
+        "minPoolSize": min_pool_size,
+        "maxPoolSize": max_pool_size,
+        "appname": appname,
+    }
+    # pymongo не принимает compressors=None, поэтому параметр
+    # передается только при явно заданном значении
+    if compressors is not None:
+        client_kwargs["compressors"] = compressors
+    client = AsyncIOMotorClient(str(mongo_uri), **client_kwargs)
     db = client.get_database(db_name)
     global grid_fs_bucket
     grid_fs_bucket = AsyncIOMotorGridFSBucket(db)
+    global fs_files_collection
+    fs_files_collection = db["fs.files"]
+    global fs_chunks_collection
+    fs_chunks_collection = db["fs.chunks"]
+    await client.admin.command("ping")
@@ -9,17 +9,22 @@
     - File: Модель для работы с файлами в GridFS.
 """
 
+import asyncio
+import base64
 import logging
 import os
-from collections.abc import AsyncGenerator
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, Mapping
 from datetime import datetime
-from typing import Self
+from typing import ClassVar, Protocol, Self
 
 import aiofiles
-import gridfs
 from beanie import PydanticObjectId
+from bson import ObjectId
+from gridfs.errors import GridFSError
 from motor.motor_asyncio import AsyncIOMotorGridOut
 from pydantic import BaseModel, Field
+from pymongo.errors import PyMongoError
 from starlette import status
 from starlette.exceptions import HTTPException
 
@@ -29,10 +34,34 @@ from .utils import get_content_type_by_filename
 
 UNKNOWN_FILE_TAG = "unknown"
 
+# Размер чанка при чтении файла с диска
+_DISK_CHUNK_SIZE = 1 << 20
+
+# Карты "значение -> элемент перечисления" для разбора метаданных без
+# дорогостоящего исключения на каждом неизвестном или отсутствующем значении
+_CONTENT_TYPE_BY_VALUE = ContentType._value2member_map_
+_ENCODING_BY_VALUE = FileEncoding._value2member_map_
+
+
+class SupportsAsyncRead(Protocol):
+    """Протокол источника данных с асинхронным чтением порциями."""
+
+    async def read(self, size: int) -> bytes: ...
+
 
 class File(BaseModel):
     """Модель с методами для работы с файлами в GridFS."""
 
+    _b64_cache: ClassVar[OrderedDict[PydanticObjectId, bytes]] = OrderedDict()
+    _b64_cache_max: ClassVar[int] = 128
+    # Метаданные файла неизменяемы для данного file_id, поэтому модели
+    # безопасно кешируются до удаления файла
+    _meta_cache: ClassVar[OrderedDict[PydanticObjectId, "File"]] = OrderedDict()
+    _meta_cache_max: ClassVar[int] = 4096
+    _bytes_cache: ClassVar[OrderedDict[PydanticObjectId, bytes]] = OrderedDict()
+    _bytes_cache_max_total: ClassVar[int] = 64 * 1024 * 1024
+    _bytes_cache_total: ClassVar[int] = 0
+
     id: PydanticObjectId = Field(
         alias="_id",
         title="id файла",
@@ -61,13 +90,57 @@ class File(BaseModel):
             bytes: Содержимое файла в виде байтов.
 
         Notes:
+            - Содержимое небольших файлов кешируется в памяти процесса
+              (LRU, суммарно не больше _bytes_cache_max_total байт).
             - Может возникнуть ошибка от библиотеки motor во время выполнения.
         """
-        grid_out = await GridFSService.download_file(self.id)
-        try:
-            return await grid_out.read()
-        finally:
-            grid_out.close()
+        cached = File._bytes_cache.get(self.id)
+        if cached is not None:
+            File._bytes_cache.move_to_end(self.id)
+            return cached
+        data = await GridFSService.download_to_bytes(self.id)
+        if len(data) < File._bytes_cache_max_total:
+            # Конкурентное чтение могло успеть записать ключ, пока
+            # содержимое скачивалось; без вычитания прежнего размера
+            # счетчик занятой памяти завышался бы навсегда
+            previous = File._bytes_cache.pop(self.id, None)
+            if previous is not None:
+                File._bytes_cache_total -= len(previous)
+            File._bytes_cache[self.id] = data
+            File._bytes_cache_total += len(data)
+            while File._bytes_cache_total > File._bytes_cache_max_total:
+                _, evicted = File._bytes_cache.popitem(last=False)
+                File._bytes_cache_total -= len(evicted)
+        return data
+
+    async def read_b64(self) -> bytes:
+        """
+        Чтение файла из GridFS в виде base64.
+
+        Результат кешируется по идентификатору файла (LRU, ограниченного
+        размера), чтобы при массовых рассылках одно и то же вложение
+        кодировалось один раз, а не на каждого получателя. Само
+        кодирование нагружает процессор и выполняется в пуле потоков,
+        чтобы не блокировать event loop.
+
+        Returns:
+            bytes: Содержимое файла в кодировке base64.
+
+        Notes:
+            - Может возникнуть ошибка от библиотеки motor во время выполнения.
+        """
+        cached = self._b64_cache.get(self.id)
+        if cached is not None:
+            self._b64_cache.move_to_end(self.id)
+            return cached
+        data = await self.read()
+        encoded = await asyncio.get_running_loop().run_in_executor(
+            None, base64.encodebytes, data
+        )
+        self._b64_cache[self.id] = encoded
+        while len(self._b64_cache) > self._b64_cache_max:
+            self._b64_cache.popitem(last=False)
+        return encoded
 
     async def open_stream(self) -> AsyncIOMotorGridOut:
         """
@@ -88,7 +161,6 @@ class File(BaseModel):
         filepath: str = "",
         tag: str = UNKNOWN_FILE_TAG,
         encoding: FileEncoding = FileEncoding.UTF_8,
-        mode: str = "r",
         autoremove_before: datetime | None = None,
     ) -> Self | None:
         """
@@ -105,36 +177,41 @@ class File(BaseModel):
             File | None: Загруженный файл или None в случае ошибки.
 
         Notes:
+            - Файл читается с диска в бинарном режиме и передается в GridFS
+              по чанкам, поэтому в памяти держится не больше одного чанка.
             - Может возникнуть ошибка от библиотек motor и aiofiles во время выполнения.
         """
         try:
-            async with aiofiles.open(filepath + filename, mode, encoding=encoding) as f:  # type: ignore
-                content_type = get_content_type_by_filename(
-                    filename=filename,
-                    with_default=True,
-                )
-                metadata = {
-                    "content_type": content_type,
-                    "tag": tag,
-                    "encoding": encoding,
-                    "autoremove_before": autoremove_before,
-                }
-                file_id = await GridFSService.upload_file(
-                    await f.read(),
-                    filename,
-                    metadata=metadata,
-                )
-                file = cls(
-                    _id=PydanticObjectId(file_id),
-                    name=filename,
-                    content_type=content_type,
-                    tag=tag,
-                    encoding=encoding,
-                )
-            return file
-        except Exception as e:
-            print("Error while downloading file to disk: %s", e)
-            logging.error("Error while downloading file to disk: %s", e)
+            content_type = get_content_type_by_filename(
+                filename=filename,
+                with_default=True,
+            )
+            metadata = {
+                "content_type": content_type,
+                "tag": tag,
+                "encoding": encoding,
+                "autoremove_before": autoremove_before,
+            }
+            grid_in = GridFSService.open_upload_stream(filename, metadata=metadata)
+            try:
+                async with aiofiles.open(os.path.join(filepath, filename), "rb") as f:
+                    while chunk := await f.read(_DISK_CHUNK_SIZE):
+                        await grid_in.write(chunk)
+            except BaseException:
+                # abort отбрасывает незавершенную загрузку; close
+                # зафиксировал бы в GridFS пустой или усеченный файл
+                await grid_in.abort()
+                raise
+            await grid_in.close()
+            return cls(
+                _id=PydanticObjectId(grid_in._id),
+                name=filename,
+                content_type=content_type,
+                tag=tag,
+                encoding=encoding,
+            )
+        except (OSError, GridFSError, PyMongoError):
+            logging.exception("Error while downloading file from disk")
             return None
 
     async def upload_file_to_disk(self, filepath: str) -> bool:
@@ -148,18 +225,22 @@ class File(BaseModel):
             bool: Успех операции.
 
         Notes:
+            - Файл пишется на диск чанками в бинарном режиме, поэтому в памяти
+              держится не больше одного чанка GridFS.
             - Может возникнуть ошибка от библиотек motor и aiofiles во время выполнения.
         """
 
         try:
-            async with aiofiles.open(
-                filepath + self.name, "w", encoding=self.encoding
-            ) as f:
-                data = (await self.read()).decode(self.encoding)
-                await f.write(data)
+            grid_out = await self.open_stream()
+            try:
+                async with aiofiles.open(os.path.join(filepath, self.name), "wb") as f:
+                    while chunk := await grid_out.readchunk():
+                        await f.write(chunk)
+            finally:
+                grid_out.close()
             return True
-        except Exception as e:
-            logging.error("Error while writing file to disk: %s", e)
+        except (OSError, GridFSError, PyMongoError):
+            logging.exception("Error while writing file to disk")
             return False
 
     async def delete_file_from_disk(
@@ -180,12 +261,21 @@ class File(BaseModel):
         """
 
         try:
-            os.remove(filepath + self.name)
+            os.remove(os.path.join(filepath, self.name))
             return True
-        except Exception as e:
-            logging.error("Error while removing file to disk: %s", e)
+        except OSError:
+            logging.exception("Error while removing file from disk")
         return False
 
+    @classmethod
+    def _evict_from_caches(cls, file_id: PydanticObjectId | ObjectId):
+        """Удаление всех кешированных данных файла из кешей процесса."""
+        File._b64_cache.pop(file_id, None)
+        File._meta_cache.pop(file_id, None)
+        cached_bytes = File._bytes_cache.pop(file_id, None)
+        if cached_bytes is not None:
+            File._bytes_cache_total -= len(cached_bytes)
+
     async def delete(self) -> bool:
         """
         Удаление файла из GridFS.
@@ -194,6 +284,7 @@ class File(BaseModel):
             bool: Успех операции.
         """
 
+        self._evict_from_caches(self.id)
         return await GridFSService.delete_file(self.id)
 
     @classmethod
@@ -255,6 +346,71 @@ class File(BaseModel):
         )
         return file
 
+    @classmethod
+    async def create_from_stream(
+        cls,
+        reader: SupportsAsyncRead,
+        filename: str | None,
+        tag: str = UNKNOWN_FILE_TAG,
+        encoding: FileEncoding = FileEncoding.UTF_8,
+        allowed_file_extensions: FileExtensionGroup = FileExtensionGroup.ALL,
+        autoremove_before: datetime | None = None,
+    ) -> Self:
+        """
+        Загрузка файла в GridFS из потока.
+
+        Args:
+            reader (SupportsAsyncRead): Источник данных с асинхронным методом read.
+            filename (str | None): Название файла.
+            tag (str): Тег файла.
+            encoding (FileEncoding): Кодировка файла.
+            allowed_file_extensions (FileExtensionGroup): Разрешенные расширения файла
+            autoremove_before (datetime | None): Автоудаление файла после указанного времени
+
+        Returns:
+            File: Загруженный файл.
+
+        Raises:
+            HTTPException: Если имя файла пустое.
+
+        Notes:
+            - Данные передаются в GridFS по чанкам, поэтому в памяти держится
+              не больше одного чанка, в отличие от create.
+            - Может возникнуть ошибка от библиотеки motor во время выполнения.
+        """
+        if not filename:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="File name cannot be empty",
+            )
+        content_type = get_content_type_by_filename(
+            filename=filename,
+            allowed_file_extensions=allowed_file_extensions,
+        )
+        metadata = {
+            "content_type": content_type,
+            "tag": tag,
+            "encoding": encoding,
+            "autoremove_before": autoremove_before,
+        }
+        grid_in = GridFSService.open_upload_stream(filename, metadata=metadata)
+        try:
+            while chunk := await reader.read(_DISK_CHUNK_SIZE):
+                await grid_in.write(chunk)
+        except BaseException:
+            # abort отбрасывает незавершенную загрузку; close
+            # зафиксировал бы в GridFS частично переданный файл
+            await grid_in.abort()
+            raise
+        await grid_in.close()
+        return cls(
+            _id=PydanticObjectId(grid_in._id),
+            name=filename,
+            content_type=content_type,
+            tag=tag,
+            encoding=encoding,
+        )
+
     @classmethod
     async def get(cls, file_id: PydanticObjectId) -> Self | None:
         """
@@ -267,13 +423,21 @@ class File(BaseModel):
             File | None: Файл или None, если не найден.
 
         Notes:
+            - Модель кешируется в памяти процесса по идентификатору файла
+              (метаданные файла неизменяемы до его удаления).
             - Может возникнуть ошибка от библиотеки motor во время выполнения.
         """
-        try:
-            grid_out = await GridFSService.download_file(file_id)
-        except gridfs.NoFile:
+        cached = File._meta_cache.get(file_id)
+        if cached is not None:
+            File._meta_cache.move_to_end(file_id)
+            return cached  # type: ignore
+        file_info = await GridFSService.get_file_info(file_id)
+        if file_info is None:
             return None
-        file = await cls.__build_file(grid_out)
+        file = await cls.__build_file(file_info)
+        File._meta_cache[file_id] = file
+        while len(File._meta_cache) > File._meta_cache_max:
+            File._meta_cache.popitem(last=False)
         return file
 
     @classmethod
@@ -288,49 +452,52 @@ class File(BaseModel):
            FileAsyncIterator: Итератор файлов.
 
         Notes:
+            - Итерируются документы коллекции fs.files с проекцией, без
+              создания объектов чтения GridFS на каждый файл.
             - Может возникнуть ошибка от библиотеки motor во время выполнения.
         """
 
-        cursor = await GridFSService.find_files(query)
+        cursor = GridFSService.find_file_infos(query)
         try:
-            async for grid_out in cursor:
-                yield await cls.__build_file(grid_out)
+            async for file_info in cursor:
+                yield await cls.__build_file(file_info)
         finally:
             await cursor.close()
 
     @classmethod
     async def __build_file(
         cls,
-        grid_out: AsyncIOMotorGridOut,
+        file_info: Mapping | AsyncIOMotorGridOut,
     ):
         """
         Создание экземпляра File на основе данных из GridFS.
 
         Args:
-            grid_out (AsyncIOMotorGridOut): Данные файла из GridFS.
+            file_info (Mapping | AsyncIOMotorGridOut): Документ из коллекции
+                fs.files или объект чтения файла из GridFS.
 
         Returns:
             File: Созданный файл.
         """
-        content_type = ContentType.DEFAULT
-        tag = UNKNOWN_FILE_TAG
-        encoding = FileEncoding.UTF_8
-        if grid_out.metadata:
-            try:
-                content_type = ContentType(grid_out.metadata["content_type"])
-            except:
-                pass
-            try:
-                tag = grid_out.metadata["tag"]
-            except:
-                pass
-            try:
-                encoding = FileEncoding(grid_out.metadata["encoding"])
-            except:
-                pass
+        if isinstance(file_info, AsyncIOMotorGridOut):
+            file_id = file_info._id
+            filename = file_info.filename
+            metadata = file_info.metadata
+        else:
+            file_id = file_info["_id"]
+            filename = file_info.get("filename")
+            metadata = file_info.get("metadata")
+        metadata = metadata or {}
+        content_type = _CONTENT_TYPE_BY_VALUE.get(
+            metadata.get("content_type"), ContentType.DEFAULT
+        )
+        tag = metadata.get("tag") or UNKNOWN_FILE_TAG
+        encoding = _ENCODING_BY_VALUE.get(
+            metadata.get("encoding"), FileEncoding.UTF_8
+        )
         return cls(
-            _id=PydanticObjectId(grid_out._id),
-            name=grid_out.filename if grid_out.filename else "Неизвестный файл",
+            _id=PydanticObjectId(file_id),
+            name=filename if filename else "Неизвестный файл",
             content_type=content_type,
             tag=tag,
             encoding=encoding,
@@ -338,7 +505,10 @@ class File(BaseModel):
 
     @classmethod
     async def delete_autoremove_files(cls):
-        async for file in File.find(
+        deleted_ids = await GridFSService.bulk_delete_files(
             {"metadata.autoremove_before": {"$lte": datetime.now()}}
-        ):
-            await file.delete()
+        )
+        # Без вытеснения кеши продолжали бы отдавать содержимое
+        # и модели уже удаленных файлов
+        for file_id in deleted_ids:
+            cls._evict_from_caches(file_id)
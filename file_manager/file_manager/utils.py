@@ -2,12 +2,36 @@
 Модуль с дополнительными утилитами для работы с файлами
 """
 
+from functools import lru_cache
+
 from starlette import status
 from starlette.exceptions import HTTPException
 
 from .constants import ContentType, FileExtensionGroup
 
 
+@lru_cache(maxsize=1024)
+def _get_content_type_by_extension(
+    extension: str,
+    allowed_file_extensions: FileExtensionGroup,
+    with_default: bool,
+) -> ContentType | None:
+    """
+    Определение типа контента по расширению файла (с кешированием)
+
+    Args:
+        extension (str): Расширение файла в нижнем регистре
+        allowed_file_extensions (FileExtensionGroup): Разрешенные расширения файла
+        with_default (bool): Возвращать ли ContentType.DEFAULT для неизвестных расширений
+
+    Returns:
+        ContentType | None: Тип контента или None, если расширение не разрешено
+    """
+    return allowed_file_extensions.content_type_map.get(
+        extension, ContentType.DEFAULT if with_default else None
+    )
+
+
 def get_content_type_by_filename(
     filename: str,
     allowed_file_extensions: FileExtensionGroup = FileExtensionGroup.ALL,
@@ -19,17 +43,16 @@ def get_content_type_by_filename(
     Args:
         filename (str): Название файла
     """
-    filename_split = filename.split(".")
-    if len(filename_split) < 2:
+    _, sep, extension = filename.rpartition(".")
+    if not sep:
         if with_default:
             return ContentType.DEFAULT
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid file extension",
         )
-    extension = filename_split[-1].lower()
-    content_type = allowed_file_extensions.content_type_map.get(
-        extension, ContentType.DEFAULT if with_default else None
+    content_type = _get_content_type_by_extension(
+        extension.lower(), allowed_file_extensions, with_default
     )
     if not content_type:
         raise HTTPException(
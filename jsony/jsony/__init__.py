@@ -1,4 +1,4 @@
-from .encoder import JSONYEncoder
+from .encoder import JSONYEncoder, jsony_default
 from .funcs import dump, dumps, normalize
 
 __all__ = [
@@ -6,4 +6,5 @@ __all__ = [
     "dumps",
     "normalize",
     "JSONYEncoder",
+    "jsony_default",
 ]
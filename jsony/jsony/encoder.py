@@ -2,13 +2,20 @@ import json
 from enum import Enum
 
 
+def jsony_default(o):
+    """
+    Преобразование объекта, который не умеет сериализовать стандартный json,
+    в сериализуемое значение. Используется как метод default в JSONYEncoder
+    и как хук default для сторонних сериализаторов (например orjson).
+    """
+    if isinstance(o, Enum):
+        return o.value
+    if hasattr(o, "__iter__"):
+        return list(o)
+    return str(o)
+
+
 class JSONYEncoder(json.JSONEncoder):
 
     def default(self, o):
-        if isinstance(o, Enum):
-            return o.value
-        if hasattr(o, "__iter__"):
-            return list(o)
-        if hasattr(o, "__str__"):
-            return str(o)
-        return super().default(o)
+        return jsony_default(o)
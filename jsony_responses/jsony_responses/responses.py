@@ -4,6 +4,11 @@ import typing
 import jsony
 from starlette.responses import JSONResponse
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 
 class JSONYResponse(JSONResponse):
     """
@@ -24,6 +29,14 @@ class JSONYResponse(JSONResponse):
     """
 
     def render(self, content: typing.Any) -> bytes:
+        if orjson is not None:
+            # OPT_PASSTHROUGH_DATETIME отдает datetime в jsony_default,
+            # чтобы формат дат совпадал с путем через json.dumps
+            return orjson.dumps(
+                content,
+                default=jsony.jsony_default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+            )
         return json.dumps(
             content,
             ensure_ascii=False,
@@ -1,6 +1,8 @@
-from collections.abc import Iterable
+from collections.abc import Callable, Mapping
 from enum import Enum
+from functools import lru_cache
 from typing import Any
+from urllib.parse import parse_qsl
 
 from starlette import status
 from starlette.datastructures import QueryParams
@@ -8,6 +10,53 @@ from starlette.exceptions import HTTPException
 
 from qp_translator.schemes import Filter, ParseResult
 
+# Служебные параметры запроса, не являющиеся фильтрами
+_SKIP_KEYS = frozenset(("limit", "offset", "sort_by"))
+
+# Количество результатов парсинга, кешируемых на каждый класс фильтров
+_PARSE_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=None)
+def _enum_info(enum_type: type[Enum]) -> str:
+    """
+    Строковое описание Enum-типа для документации фильтров.
+
+    Кешируется по типу: в иерархиях классов один и тот же Enum
+    встречается многократно и форматируется только один раз.
+    """
+    enum_values = ", ".join([e.value for e in enum_type])
+    return f"{enum_type.__bases__[0].__name__}({enum_values})"
+
+
+def _filter_info(f: Filter) -> str:
+    """Функция для извлечения информации о фильтре."""
+    orig_class = getattr(f, "__orig_class__", None)
+    type_info = orig_class.__args__[0] if orig_class is not None else str
+    if issubclass(type_info, Enum):
+        type_info = _enum_info(type_info)
+    else:
+        type_info = type_info.__name__
+    return f"{f.description + '<br><br>' if f.description else ''}**ValueType:** {type_info}<br>**Many:** {f.many}<br>**Is Required:** {f.is_required}{'<br>**Exclusions:** ' + ', '.join(f.exclusions) if f.exclusions else ''}"
+
+
+def _safe_int(v: str | None) -> int | None:
+    """
+    Преобразование строки в int одним проходом, без предварительного isdigit.
+
+    Args:
+        v (str | None): Строковое значение параметра.
+
+    Returns:
+        int | None: Число или None, если значение отсутствует или некорректно.
+    """
+    if v is None:
+        return None
+    try:
+        return int(v)
+    except ValueError:
+        return None
+
 
 class QPTranslatorMetaclass(type):
 
@@ -28,88 +77,115 @@ class QPTranslatorMetaclass(type):
         )
         namespace["__filters__"] = filters
         namespace["__required_filter_set__"] = required_filter_set
+        # Таблица "параметр -> (t_parser, q_func, many, exclusions)",
+        # собранная один раз при создании класса, чтобы parse не ходил
+        # по атрибутам pydantic-модели на каждый параметр запроса
+        namespace["__filter_table__"] = {
+            n: (f.t_parser, f.q_func, f.many, frozenset(f.exclusions))
+            for n, f in filters.items()
+        }
+        namespace["__skip_keys__"] = _SKIP_KEYS
         namespace["__docs__"] = ""
-        if namespace["__filters__"]:
-
-            def filter_info(f: Filter):
-                """Функция для извлечения информации о фильтре."""
-                type_info = f.__pydantic_generic_metadata__["args"][0]  # type: ignore
-                if issubclass(type_info, Enum):  # Проверяем, является ли тип Enum
-                    enum_values = ", ".join(
-                        [e.value for e in type_info]
-                    )  # Получаем имена всех значений Enum
-                    type_info = f"{type_info.__bases__[0].__name__ }({enum_values})"
-                else:
-                    type_info = type_info.__name__
-                return f"{f.description + '<br><br>' if f.description else ''}**ValueType:** {type_info}<br>**Many:** {f.many}<br>**Is Required:** {f.is_required}{'<br>**Exclusions:** ' + ', '.join(f.exclusions) if f.exclusions else ''}"
-
+        if filters:
             namespace["__docs__"] = "<h2>Filters:</h2>" + "<br>".join(
-                f"<br><h3>{n}</h3>{filter_info(f)}"
-                for n, f in namespace["__filters__"].items()
+                [f"<br><h3>{n}</h3>{_filter_info(f)}" for n, f in filters.items()]
             )
-        return super().__new__(cls, name, bases, namespace)
+        klass = super().__new__(cls, name, bases, namespace)
+        # Кеш результатов парсинга у каждого класса свой: lru_cache
+        # оборачивает связанный метод именно этого класса
+        klass.__parse_cache__ = lru_cache(maxsize=_PARSE_CACHE_SIZE)(
+            klass._parse_impl
+        )
+        return klass
 
 
 class QPTranslator(metaclass=QPTranslatorMetaclass):
 
     __filters__: dict[str, Filter[Any]] = {}
+    __filter_table__: dict[str, tuple[Callable, Callable, bool, frozenset[str]]] = {}
     __required_filter_set__: set[str] = set()
+    __skip_keys__: frozenset[str] = _SKIP_KEYS
     __docs__: str = ""
+    __parse_cache__: Callable[[str], ParseResult]
+
+    @classmethod
+    def parse(cls, qps: QueryParams) -> ParseResult:
+        """
+        Парсинг параметров запроса.
+
+        Результат кешируется по сырой строке запроса (LRU на класс):
+        одинаковые строки от опрашивающих клиентов не парсятся повторно.
+        Возвращаемый ParseResult разделяется между вызовами и не должен
+        изменяться вызывающим кодом.
+        """
+        return cls.__parse_cache__(str(qps))
 
     @classmethod
-    async def parse(cls, qps: QueryParams) -> ParseResult:
+    def _parse_impl(cls, query_string: str) -> ParseResult:
 
-        limit = qps.get("limit")
-        offset = qps.get("offset")
+        # Один проход по параметрам вместо повторных qps.get/qps.getlist
+        # на каждый параметр
+        buckets: dict[str, list[str]] = {}
+        for k, v in parse_qsl(query_string, keep_blank_values=True):
+            bucket = buckets.get(k)
+            if bucket is None:
+                buckets[k] = [v]
+            else:
+                bucket.append(v)
+        limit_values = buckets.get("limit")
+        offset_values = buckets.get("offset")
         filter_params = ParseResult(
-            limit=int(limit) if limit and limit.isdigit() else None,
-            offset=int(offset) if offset and offset.isdigit() else None,
-            sort=qps.getlist("sort_by"),
+            limit=_safe_int(limit_values[0] if limit_values else None),
+            offset=_safe_int(offset_values[0] if offset_values else None),
+            sort=buckets.get("sort_by", []),
         )
         query: dict[str, dict[str, Any]] = {}
-        qp_keys = qps.keys()
         invalid_qps = set()
-        for param in qp_keys:
-            if param in ["limit", "offset", "sort_by"] or param in query:
+        filter_table = cls.__filter_table__
+        skip_keys = cls.__skip_keys__
+        for param, values in buckets.items():
+            if param in skip_keys:
                 continue
-            f = cls.__filters__.get(param)
-            if not f:
+            filter_entry = filter_table.get(param)
+            if filter_entry is None:
                 invalid_qps.add(param)
                 continue
-            for exclusion in f.exclusions:
-                if exclusion in qp_keys:
-                    query[param] = {}
-                    break
-            else:
-                try:
-                    if f.many:
-                        value = [f.t_parser(p) for p in qps.getlist(param)]
-                    else:
-                        value = f.t_parser(qps.get(param))  # type: ignore
-                except ValueError as e:
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail=str(e),
-                    ) from e
-                except Exception as e:
-                    raise Warning("t_parser can only raise a ValueError") from e
-                query[param] = f.q_func(value)
+            t_parser, q_func, many, exclusions = filter_entry
+            # Проверка пересечения множеств одним C-вызовом вместо
+            # питоновского цикла по исключениям
+            if exclusions and not exclusions.isdisjoint(buckets):
+                query[param] = {}
+                continue
+            try:
+                if many:
+                    value = [t_parser(p) for p in values]
+                else:
+                    value = t_parser(values[0])
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=str(e),
+                ) from e
+            except Exception as e:
+                raise Warning("t_parser can only raise a ValueError") from e
+            query[param] = q_func(value)
         if invalid_qps:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f'Invalid query params: {", ".join(invalid_qps)}',
             )
-        await cls._check_required_filters(query.keys())
+        cls._check_required_filters(query)
         filter_params.query_list = list(query.values())
         return filter_params
 
     @classmethod
-    async def _check_required_filters(cls, existing_filters: Iterable[str]):
+    def _check_required_filters(cls, query: Mapping[str, Any]):
         if not cls.__required_filter_set__:
             return
-        if undefined_required_filters := cls.__required_filter_set__ - set(
-            existing_filters
-        ):
+        undefined_required_filters = [
+            f for f in cls.__required_filter_set__ if f not in query
+        ]
+        if undefined_required_filters:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Required query params: {', '.join(undefined_required_filters)}",
@@ -1,12 +1,22 @@
 from collections.abc import Callable
+from dataclasses import dataclass, field
 from typing import Any, Generic, TypeVar
 
-from pydantic import BaseModel, Field
-
 T = TypeVar("T")
 
 
-class Filter(BaseModel, Generic[T]):
+class _FilterSlotsBase:
+    """
+    База со слотом под __orig_class__: typing записывает туда
+    параметризованный тип (Filter[X]) при создании экземпляра, и без
+    этого слота информация о типе для документации терялась бы.
+    """
+
+    __slots__ = ("__orig_class__",)
+
+
+@dataclass(slots=True)
+class Filter(_FilterSlotsBase, Generic[T]):
     """
     Класс фильтра для параметров запроса.
 
@@ -14,13 +24,18 @@ class Filter(BaseModel, Generic[T]):
     функции для парсинга значений, применения условий фильтрации и определения,
     является ли фильтр обязательным.
 
+    Фильтр создается один раз при объявлении класса, а его атрибуты читаются
+    на каждом запросе, поэтому это слотированный dataclass: доступ к атрибутам
+    идет через C-слоты, без дескрипторов pydantic.
+
     Attrs:
         q_func (Callable[[T | list[T]], dict[str, Any]]): Функция для преобразования
             значений фильтра в словарь для запроса к базе данных.
         t_parser (Callable[[str], T | list[T]]): Функция для преобразования строки
             в нужный тип данных.
         many (bool): Если True, фильтр может принимать список значений.
-        exclusions (list[str]): Список фильтров, которые исключают текущий фильтр.
+        exclusions (tuple[str, ...] | list[str]): Ключи фильтров, которые
+            исключают текущий фильтр.
         is_required (bool): Если True, фильтр обязателен.
         description (str | None): Описание фильтра.
 
@@ -31,37 +46,21 @@ class Filter(BaseModel, Generic[T]):
                     q_func=lambda x: {"provider_id": x},
                     t_parser=StandartParser.get_type_parser(PydanticObjectId),
                     many=True,
-                    exclusions=["position_id"],
+                    exclusions=("position_id",),
                 ),
             }
     """
 
-    q_func: Callable[[T | list[T]], dict[str, Any]] = Field(
-        title="Функция, возвращающая словарь для запроса к базе данных",
-    )
-    t_parser: Callable[[str], T | list[T]] = Field(
-        default=lambda x: x,
-        title="Функция для преобразования строки в нужный тип данных",
-    )
-    many: bool = Field(
-        default=False,
-        title="Определяет, может ли фильтр принимать список значений",
-    )
-    exclusions: list[str] = Field(
-        default_factory=list,
-        title="Список ключей фильтров, которые исключают текущий фильтр",
-    )
-    is_required: bool = Field(
-        default=False,
-        title="Если фильтр обязателен",
-    )
-    description: str | None = Field(
-        default=None,
-        title="Описание фильтра",
-    )
-
-
-class ParseResult(BaseModel):
+    q_func: Callable[[T | list[T]], dict[str, Any]]
+    t_parser: Callable[[str], T | list[T]] = lambda x: x  # noqa: E731
+    many: bool = False
+    exclusions: tuple[str, ...] | list[str] = ()
+    is_required: bool = False
+    description: str | None = None
+
+
+@dataclass(slots=True)
+class ParseResult:
     """
     Модель результата парсинга параметров запроса.
 
@@ -69,6 +68,10 @@ class ParseResult(BaseModel):
     из параметров запроса API. Он также включает информацию о сортировке,
     лимите и смещении (пагинации).
 
+    Экземпляр создается на каждый запрос, поэтому это слотированный
+    dataclass: без __dict__ и служебных структур pydantic он занимает
+    заметно меньше памяти.
+
     Attrs:
         query_list (list[dict[str, Any]]): Список фильтров, полученных из параметров запроса.
         sort (list[str]): Список ключей сортировки, указанных в запросе.
@@ -76,19 +79,7 @@ class ParseResult(BaseModel):
         offset (int | None): Смещение для пагинации результатов.
     """
 
-    query_list: list[dict[str, Any]] = Field(
-        default_factory=list,
-        title="Список фильтров, полученных из параметров запроса",
-    )
-    sort: list[str] = Field(
-        default_factory=list,
-        title="Ключи сортировки, указанные в запросе",
-    )
-    limit: int | None = Field(
-        default=None,
-        title="Лимит на количество возвращаемых результатов",
-    )
-    offset: int | None = Field(
-        default=None,
-        title="Смещение для пагинации результатов",
-    )
+    query_list: list[dict[str, Any]] = field(default_factory=list)
+    sort: list[str] = field(default_factory=list)
+    limit: int | None = None
+    offset: int | None = None
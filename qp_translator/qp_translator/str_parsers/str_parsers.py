@@ -1,9 +1,26 @@
 from collections.abc import Callable
 from datetime import datetime
+from functools import lru_cache
 from typing import TypeVar
 
 T = TypeVar("T")
 
+# Таблица булевых значений: O(1) поиск по хешу вместо линейного
+# прохода по списку на каждый вызов
+_BOOL_MAP = {"true": True, "false": False}
+
+
+@lru_cache(maxsize=None)
+def _enum_type_info(enum: type) -> str:
+    """
+    Строковое описание Enum-типа для сообщения об ошибке.
+
+    Кешируется по типу: значения Enum не меняются, и строка
+    форматируется один раз, а не на каждое некорректное значение.
+    """
+    enum_values = ", ".join([e.value for e in enum])  # type: ignore
+    return f"{enum.__bases__[0].__name__}({enum_values})"
+
 
 def datetime_parser(v: str) -> datetime:
     """
@@ -37,23 +54,42 @@ def bool_parser(v: str) -> bool:
     Returns:
         bool: Результат парсинга.
     """
-    if v not in ["false", "true"]:
+    r = _BOOL_MAP.get(v)
+    if r is None:
         raise ValueError("Field with bool must be 'false' or 'true'")
-    return v != "false"
+    return r
+
+
+# Таблица парсеров для распространенных типов: возвращаются напрямую,
+# без замыкания-обертки на каждый вызов
+_TYPE_PARSER_TABLE: dict[type, Callable] = {
+    str: str,
+    int: int,
+    float: float,
+    bool: bool_parser,
+    datetime: datetime_parser,
+}
 
 
 def get_type_parser(_type: type[T]) -> Callable[[str], T]:
     """
     Метод для получения парсера для типовых значений.
 
+    Для распространенных типов (str, int, float, bool, datetime) возвращает
+    готовый парсер из таблицы; для остальных — обертку с преобразованием
+    ошибок в ValueError.
+
     Args:
         _type (type[T]): Тип, для которого требуется парсер.
 
     Returns:
         Callable[[str], T]: Парсер, который преобразует строку в указанный тип.
     """
+    fast_parser = _TYPE_PARSER_TABLE.get(_type)
+    if fast_parser is not None:
+        return fast_parser
 
-    def type_parser(v: str) -> T:
+    def type_parser(v: str, _type: type[T] = _type) -> T:
         try:
             return _type(v)  # type: ignore
         except Exception as e:
@@ -75,12 +111,13 @@ def get_enum_parser(enum: type[T]) -> Callable[[str], T]:
         Callable[[str], T]: Парсер, который преобразует строку в элемент Enum.
     """
 
-    def enum_parser(v: str) -> T:
+    def enum_parser(v: str, _enum: type[T] = enum) -> T:
+        # Класс Enum привязан через аргумент по умолчанию: LOAD_FAST
+        # вместо обращения к ячейке замыкания на каждый вызов
         try:
-            return enum(v)  # type: ignore
+            return _enum(v)  # type: ignore
         except ValueError as e:
-            enum_values = ", ".join([e.value for e in enum])  # type: ignore
-            type_info = f"{enum.__bases__[0].__name__ }({enum_values})"
+            type_info = _enum_type_info(_enum)
             raise ValueError(f"Value '{v}' is not a valid member of {type_info}") from e
 
     return enum_parser
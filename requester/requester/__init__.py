@@ -1,10 +1,18 @@
 from . import constants
-from .request import send_request_with_log
+from .request import (
+    close_session,
+    send_request_with_log,
+    start_log_worker,
+    stop_log_worker,
+)
 from .request_log import RequestInfo, RequestLog, ResponseInfo
 
 __all__ = [
     "constants",
     "send_request_with_log",
+    "close_session",
+    "start_log_worker",
+    "stop_log_worker",
     "RequestInfo",
     "RequestLog",
     "ResponseInfo",
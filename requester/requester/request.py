@@ -5,15 +5,154 @@
 """
 
 import asyncio
+import json
+import logging
 from collections.abc import Mapping
 from typing import Any
 
 import aiohttp
 from errors import FailedDependencyError
+from multidict import MultiDict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
 
 from .constants import RequestMethod
 from .request_log import RequestInfo, RequestLog, ResponseInfo
 
+_session: aiohttp.ClientSession | None = None
+
+
+def _decode_body(raw: bytes, response: aiohttp.ClientResponse) -> str:
+    """
+    Декодирование уже прочитанного тела ответа в строку.
+
+    Args:
+        raw (bytes): Тело ответа, прочитанное из сокета.
+        response (aiohttp.ClientResponse): Ответ, из заголовков которого
+            берется кодировка.
+
+    Returns:
+        str: Декодированное тело; некорректные байты заменяются, а не
+            роняют логирование ответа.
+    """
+    try:
+        encoding = response.get_encoding()
+    except RuntimeError:
+        encoding = "utf-8"
+    return raw.decode(encoding, errors="replace")
+
+
+async def _get_session() -> aiohttp.ClientSession:
+    """
+    Получение общей HTTP-сессии процесса.
+
+    Сессия создается лениво при первом запросе и переиспользуется между
+    вызовами, чтобы keep-alive соединения, кеш DNS и TLS-сессии
+    амортизировались, а не создавались заново на каждый запрос.
+    """
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=5),
+        )
+    return _session
+
+
+async def close_session():
+    """
+    Закрытие общей HTTP-сессии.
+
+    Функция должна быть вызвана при остановке приложения.
+    """
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+_log_queue: asyncio.Queue | None = None
+_log_worker_task: asyncio.Task | None = None
+
+# Максимальный размер пачки логов на одну запись в базу
+_LOG_BATCH_SIZE = 100
+
+# Заголовки ответа, попадающие в лог; остальные не копируются,
+# чтобы не строить полный dict заголовков на каждый ответ
+_LOGGED_RESPONSE_HEADERS = ("Content-Type", "Content-Length", "X-Request-Id")
+
+
+async def _log_worker():
+    """
+    Фоновая запись логов запросов пачками.
+
+    Забирает накопившиеся логи из очереди (не больше _LOG_BATCH_SIZE за раз)
+    и сохраняет их одним insert_many, снимая запись в базу с критического
+    пути запроса.
+    """
+    assert _log_queue is not None
+    while True:
+        batch = [await _log_queue.get()]
+        while len(batch) < _LOG_BATCH_SIZE and not _log_queue.empty():
+            batch.append(_log_queue.get_nowait())
+        # Запись защищена от отмены: пачка уже изъята из очереди, и
+        # отмена воркера при остановке не должна ее терять
+        insert = asyncio.ensure_future(RequestLog.insert_many(batch))
+        try:
+            await asyncio.shield(insert)
+        except asyncio.CancelledError:
+            try:
+                await insert
+            except Exception:
+                logging.exception("Error while saving request logs")
+            raise
+        except Exception:
+            logging.exception("Error while saving request logs")
+
+
+def start_log_worker(maxsize: int = 10000):
+    """
+    Запуск фоновой записи логов запросов.
+
+    Функция должна быть вызвана при старте приложения (при работающем
+    event loop). Без запуска логи сохраняются синхронно в каждом запросе.
+
+    Args:
+        maxsize (int): Максимальный размер очереди логов; при переполнении
+            лог сохраняется синхронно.
+    """
+    global _log_queue, _log_worker_task
+    if _log_worker_task is not None and not _log_worker_task.done():
+        return
+    _log_queue = asyncio.Queue(maxsize=maxsize)
+    _log_worker_task = asyncio.create_task(_log_worker())
+
+
+async def stop_log_worker():
+    """
+    Остановка фоновой записи логов с сохранением накопившихся логов.
+
+    Функция должна быть вызвана при остановке приложения.
+    """
+    global _log_queue, _log_worker_task
+    if _log_worker_task is None:
+        return
+    _log_worker_task.cancel()
+    try:
+        await _log_worker_task
+    except asyncio.CancelledError:
+        pass
+    if _log_queue is not None and not _log_queue.empty():
+        batch = []
+        while not _log_queue.empty():
+            batch.append(_log_queue.get_nowait())
+        await RequestLog.insert_many(batch)
+    _log_queue = None
+    _log_worker_task = None
+
 
 async def send_request_with_log(
     url: str,
@@ -58,7 +197,9 @@ async def send_request_with_log(
     status_code = 999
     error = None
     res_body = None
-    request_info = RequestInfo(
+    # Данные собраны внутри модуля, поэтому pydantic-валидация
+    # пропускается через model_construct
+    request_info = RequestInfo.model_construct(
         url=url,
         method=method,
         headers=headers,
@@ -66,60 +207,88 @@ async def send_request_with_log(
         query_params=query_params,
     )
     response_info = None
+    params: MultiDict | None = None
     if query_params:
-        url += "?"
+        params = MultiDict()
         for key, value in query_params.items():
             if isinstance(value, (list, set)):
-                for v in value:
-                    url += f"{str(key)}={v}&"
+                params.extend((str(key), str(v)) for v in value)
             else:
-                url += f"{str(key)}={value}&"
-    async with aiohttp.ClientSession() as session:
-        try:
-            async with session.request(
-                method=method,
-                url=url,
-                headers=headers if headers else None,
-                json=body if req_json and body else None,
-                data=body if not req_json and body else None,
-                timeout=aiohttp.ClientTimeout(5),
-            ) as response:
-                request_info.headers = response.request_info.headers
-                status_code = response.status
-                if res_json:
-                    try:
-                        res_body = await response.json()
-                    except:
-                        try:
-                            res_body = await response.text()
-                        except:
-                            pass
-                else:
-                    try:
-                        res_body = await response.text()
-                    except:
-                        pass
-                response_info = ResponseInfo(
-                    status=status_code,
-                    headers=dict(response.headers),
-                    body=res_body,
-                )
-        except aiohttp.ClientError as e:
-            error = f"ClientError - {str(e)}"
-        except asyncio.TimeoutError:
-            error = "TimeoutError"
-        except Exception as e:
-            error = str(e)
-        finally:
-            rl = RequestLog(
-                request_info=request_info,
-                response_info=response_info,
-                error=error,
-                tag=tag,
+                params.add(str(key), str(value))
+    session = await _get_session()
+    try:
+        # Сериализация тела внутри try: несериализуемое тело должно
+        # попасть в лог и подняться как FailedDependencyError, как и
+        # раньше при json=body внутри session.request
+        json_body = None
+        data = None
+        if body:
+            if not req_json:
+                data = body
+            elif orjson is not None:
+                # Сериализация C-расширением вместо чистопитоновского
+                # json.dumps внутри aiohttp
+                data = orjson.dumps(body)
+                headers = {**(headers or {}), "Content-Type": "application/json"}
+            else:
+                json_body = body
+        async with session.request(
+            method=method,
+            url=url,
+            params=params,
+            headers=headers if headers else None,
+            json=json_body,
+            data=data,
+            timeout=aiohttp.ClientTimeout(5),
+        ) as response:
+            request_info.headers = response.request_info.headers
+            status_code = response.status
+            # Тело читается из сокета один раз; json/text поверх response
+            # читали бы и декодировали его повторно
+            raw = await response.read()
+            if res_json:
+                try:
+                    if orjson is not None:
+                        res_body = orjson.loads(raw)
+                    else:
+                        res_body = json.loads(raw)
+                except ValueError:
+                    res_body = _decode_body(raw, response)
+            else:
+                res_body = _decode_body(raw, response)
+            response_info = ResponseInfo.model_construct(
+                status=status_code,
+                headers={
+                    k: response.headers[k]
+                    for k in _LOGGED_RESPONSE_HEADERS
+                    if k in response.headers
+                },
+                body=res_body,
             )
+    except aiohttp.ClientError as e:
+        error = f"ClientError - {str(e)}"
+    except asyncio.TimeoutError:
+        error = "TimeoutError"
+    except Exception as e:
+        error = str(e)
+    finally:
+        rl = RequestLog(
+            request_info=request_info,
+            response_info=response_info,
+            error=error,
+            tag=tag,
+        )
+        # При ошибке лог сохраняется синхронно: его id нужен сразу
+        # для FailedDependencyError
+        if _log_queue is not None and not error:
+            try:
+                _log_queue.put_nowait(rl)
+            except asyncio.QueueFull:
+                await rl.save()
+        else:
             await rl.save()
-            if error:
-                raise FailedDependencyError(
-                    description=error, tag=tag, request_log_id=rl.id
-                )
-        return status_code, res_body  # type: ignore
+        if error:
+            raise FailedDependencyError(
+                description=error, tag=tag, request_log_id=rl.id
+            )
+    return status_code, res_body  # type: ignore
@@ -1,7 +1,13 @@
-from .sftper import SFTP_FILE_TAG, SFTPService, config_sftp_service
+from .sftper import (
+    SFTP_FILE_TAG,
+    SFTPService,
+    close_sftp_service,
+    config_sftp_service,
+)
 
 __all__ = [
     "SFTPService",
     "config_sftp_service",
+    "close_sftp_service",
     "SFTP_FILE_TAG",
 ]
@@ -1,3 +1,5 @@
+import asyncio
+
 import asyncssh
 from file_manager import File
 
@@ -8,6 +10,39 @@ _USERNAME: str = ""
 _PASSWORD: str = ""
 _PRIVATE_KEY: asyncssh.SSHKey = None # type: ignore
 
+_conn: asyncssh.SSHClientConnection | None = None
+_sftp: asyncssh.SFTPClient | None = None
+_connect_lock = asyncio.Lock()
+
+
+async def _sftp_client() -> asyncssh.SFTPClient:
+    """
+    Получение общего SFTP-клиента процесса.
+
+    Соединение устанавливается лениво при первой операции и
+    переиспользуется между вызовами, чтобы SSH-рукопожатие и
+    аутентификация не выполнялись на каждую операцию с файлом.
+    При закрытом или оборванном соединении выполняется переподключение;
+    блокировка не дает конкурентным операциям открыть несколько
+    соединений одновременно.
+    """
+    global _conn, _sftp
+    if _conn is None or _conn.is_closed():
+        async with _connect_lock:
+            # Пока блокировка ожидалась, соединение мог открыть
+            # другой вызов
+            if _conn is None or _conn.is_closed():
+                _conn = await asyncssh.connect(
+                    host=_HOST,
+                    username=_USERNAME,
+                    password=_PASSWORD if _PASSWORD else None,
+                    client_keys=[_PRIVATE_KEY] if _PRIVATE_KEY else None,
+                    known_hosts=None,  # Указание None отключает проверку
+                )
+                _sftp = await _conn.start_sftp_client()
+    assert _sftp is not None
+    return _sftp
+
 
 class SFTPService:
     """Класс для управления файлами через SFTP"""
@@ -25,19 +60,19 @@ class SFTPService:
             remote_path (str): Путь к папке, в которую должен быть загружен файл
 
         Notes:
+            - Файл передается по чанкам GridFS, поэтому в памяти держится
+              не больше одного чанка
             - Функция может отдавать ошибки asyncssh библиотеки в ходе отправки письма
             - При работе на тестовом сервере to_email подменяется на тестовый
         """
-        async with asyncssh.connect(
-            host=_HOST,
-            username=_USERNAME,
-            password=_PASSWORD if _PASSWORD else None,
-            client_keys=[_PRIVATE_KEY] if _PRIVATE_KEY else None,
-            known_hosts=None,  # Указание None отключает проверку
-        ) as conn:
-            async with conn.start_sftp_client() as sftp:
-                async with sftp.open(remote_path + file.name, "wb") as f:
-                    await f.write(await file.read())
+        sftp = await _sftp_client()
+        grid_out = await file.open_stream()
+        try:
+            async with sftp.open(remote_path + file.name, "wb") as f:
+                while chunk := await grid_out.readchunk():
+                    await f.write(chunk)
+        finally:
+            grid_out.close()
 
     @staticmethod
     async def get(
@@ -54,24 +89,19 @@ class SFTPService:
             tag (FILE_TAG_CHOICES): Тег файла
 
         Notes:
+            - Файл передается в GridFS по чанкам, поэтому в памяти держится
+              не больше одного чанка
             - Функция может отдавать ошибки asyncssh библиотеки в ходе отправки письма
             - При работе на тестовом сервере to_email подменяется на тестовый
         """
-        async with asyncssh.connect(
-            host=_HOST,
-            username=_USERNAME,
-            password=_PASSWORD if _PASSWORD else None,
-            client_keys=[_PRIVATE_KEY] if _PRIVATE_KEY else None,
-            known_hosts=None,  # Указание None отключает проверку
-        ) as conn:
-            async with conn.start_sftp_client() as sftp:
-                remote_file_path = remote_path + filename
-                async with sftp.open(remote_file_path, "rb") as remote_file:
-                    return await File.create(
-                        file_content=await remote_file.read(),
-                        filename=filename,
-                        tag=tag,
-                    )
+        sftp = await _sftp_client()
+        remote_file_path = remote_path + filename
+        async with sftp.open(remote_file_path, "rb") as remote_file:
+            return await File.create_from_stream(
+                remote_file,
+                filename=filename,
+                tag=tag,
+            )
 
     @staticmethod
     async def remove(
@@ -89,16 +119,9 @@ class SFTPService:
             - Функция может отдавать ошибки asyncssh библиотеки в ходе отправки письма
             - При работе на тестовом сервере to_email подменяется на тестовый
         """
-        async with asyncssh.connect(
-            host=_HOST,
-            username=_USERNAME,
-            password=_PASSWORD if _PASSWORD else None,
-            client_keys=[_PRIVATE_KEY] if _PRIVATE_KEY else None,
-            known_hosts=None,  # Указание None отключает проверку
-        ) as conn:
-            async with conn.start_sftp_client() as sftp:
-                remote_file_path = remote_path + filename
-                await sftp.remove(remote_file_path)
+        sftp = await _sftp_client()
+        remote_file_path = remote_path + filename
+        await sftp.remove(remote_file_path)
 
 
 async def config_sftp_service(
@@ -117,3 +140,19 @@ async def config_sftp_service(
     if private_key:
         global _PRIVATE_KEY
         _PRIVATE_KEY = asyncssh.import_private_key(private_key)
+
+
+async def close_sftp_service():
+    """
+    Закрытие общего SFTP-соединения.
+
+    Функция должна быть вызвана при остановке приложения.
+    """
+    global _conn, _sftp
+    if _sftp is not None:
+        _sftp.exit()
+    if _conn is not None and not _conn.is_closed():
+        _conn.close()
+        await _conn.wait_closed()
+    _conn = None
+    _sftp = None
@@ -1,9 +1,14 @@
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
+# Количество скомпилированных шаблонов, удерживаемых в кеше окружения
+_TEMPLATE_CACHE_SIZE = 400
+
 _env = Environment(
     loader=FileSystemLoader("templates"),
     autoescape=select_autoescape(["html", "xml"]),
     enable_async=True,
+    auto_reload=False,
+    cache_size=_TEMPLATE_CACHE_SIZE,
 )
 """
 Environment: Глобальное окружение Jinja2 для рендера шаблонов. 
@@ -54,10 +59,12 @@ async def config_template_renderer(templates_path: str | None = None):
     Raises:
         OSError: Если директория с шаблонами недоступна или недействительна.
     """
-    if not templates_path:
+    if templates_path:
         global _env
         _env = Environment(
             loader=FileSystemLoader(templates_path),
             autoescape=select_autoescape(["html", "xml"]),
             enable_async=True,
+            auto_reload=False,
+            cache_size=_TEMPLATE_CACHE_SIZE,
         )